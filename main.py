@@ -11,27 +11,48 @@ Endpoints:
   GET  /health           → Health check
 
 Install:
-  pip install fastapi uvicorn neo4j python-dotenv sentence-transformers
+  pip install fastapi uvicorn uvloop orjson neo4j python-dotenv pyahocorasick cachetools sentence-transformers diskcache
 
 Run:
-  uvicorn main:app --reload --port 8000
+  uvicorn main:app --reload --port 8000 --loop uvloop
 """
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from neo4j import GraphDatabase
+from neo4j import AsyncGraphDatabase, AsyncSession
+from neo4j.exceptions import ClientError
+from sentence_transformers import SentenceTransformer
 from typing import Optional
-import os, re
+from contextlib import asynccontextmanager
+from cachetools import TTLCache
+import asyncio, functools, hashlib, logging, os, re
+import ahocorasick
+import diskcache
 from dotenv import load_dotenv
 
 load_dotenv()
 
+log = logging.getLogger("legal_analyser")
+
 # ─── APP SETUP ────────────────────────────────────────────────────────────────
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await ensure_schema()
+    await warm_up()
+    yield
+    # Runs after uvicorn has drained in-flight requests, so no open
+    # transaction is cut off when the pool closes
+    await driver.close()
+
+
 app = FastAPI(
     title="Legal Analyser API",
     description="Neuro-Symbolic AI for Indian Penal Code case analysis",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -46,11 +67,28 @@ app.add_middleware(
 NEO4J_URI      = os.getenv("NEO4J_URI",      "bolt://localhost:7687")
 NEO4J_USER     = os.getenv("NEO4J_USER",     "neo4j")
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "your_password_here")
+NEO4J_DATABASE = os.getenv("NEO4J_DATABASE", "neo4j")   # explicit name skips home-db resolution
+
+driver = AsyncGraphDatabase.driver(
+    NEO4J_URI,
+    auth=(NEO4J_USER, NEO4J_PASSWORD),
+    max_connection_pool_size=int(os.getenv("NEO4J_POOL", 100)),
+    connection_acquisition_timeout=float(os.getenv("NEO4J_ACQ_TIMEOUT", 60)),
+    max_connection_lifetime=600,
+)
 
-driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD))
+# Every API query is bounded (LIMIT or a single aggregated record), so pull the
+# whole result in one PULL message instead of 1000-record batches
+FETCH_ALL = -1
 
 def get_session():
-    return driver.session()
+    # One session per task: an async session must not run queries concurrently
+    return driver.session(database=NEO4J_DATABASE, fetch_size=FETCH_ALL)
+
+async def db():
+    """FastAPI dependency: one session per request for single-query handlers."""
+    async with get_session() as session:
+        yield session
 
 
 # ─── PYDANTIC MODELS ──────────────────────────────────────────────────────────
@@ -60,6 +98,8 @@ class AnalyzeRequest(BaseModel):
     category: Optional[str] = None   # "Criminal" | "Civil" | None
 
 
+# Response schemas below document /analyze in OpenAPI; the handler itself
+# returns plain dicts through ORJSONResponse and skips model validation.
 class ReasoningStep(BaseModel):
     step: int
     type: str          # "symbolic" | "neural" | "graph_traversal"
@@ -78,6 +118,21 @@ class AnalyzeResponse(BaseModel):
     confidence_score: float
 
 
+# ─── RESPONSE CACHE ───────────────────────────────────────────────────────────
+# The legal graph changes only on re-import, so read endpoints are memoised
+# per process for CACHE_TTL seconds.
+CACHE_TTL     = 600
+CACHE_CONTROL = f"max-age={CACHE_TTL}"
+
+_ANALYZE_CACHE = TTLCache(maxsize=1024, ttl=CACHE_TTL)
+_SECTION_CACHE = TTLCache(maxsize=4096, ttl=CACHE_TTL)
+_GRAPH_CACHE   = TTLCache(maxsize=4096, ttl=CACHE_TTL)
+
+def analyze_cache_key(req: AnalyzeRequest) -> str:
+    raw = f"{req.state}|{req.category}|{req.case_description}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
 # ─── KEYWORD EXTRACTION (Symbolic Layer) ──────────────────────────────────────
 LEGAL_KEYWORDS = {
     "cheating":          ["CHEATING_01", "CHEATING_02"],
@@ -105,419 +160,639 @@ LEGAL_KEYWORDS = {
     "forgery":           ["FORGERY_01"],
 }
 
+# Frozen (keyword, case_type_ids) rules in LEGAL_KEYWORDS order
+LEGAL_KEYWORD_RULES: tuple[tuple[str, tuple[str, ...]], ...] = tuple(
+    (keyword, tuple(case_type_ids)) for keyword, case_type_ids in LEGAL_KEYWORDS.items()
+)
+
+# Aho-Corasick automaton over all keywords: one pass over the text finds every
+# match. Each keyword maps to its rule index in LEGAL_KEYWORD_RULES.
+KEYWORD_AUTOMATON = ahocorasick.Automaton()
+for _i, (_keyword, _) in enumerate(LEGAL_KEYWORD_RULES):
+    KEYWORD_AUTOMATON.add_word(_keyword, _i)
+KEYWORD_AUTOMATON.make_automaton()
+
+# Case-insensitive "any keyword?" probe, so texts with no match skip the
+# lowercase copy and the automaton pass entirely
+ANY_KEYWORD_RE = re.compile("|".join(map(re.escape, LEGAL_KEYWORDS)), re.IGNORECASE)
+
 def extract_case_types_symbolically(text: str) -> tuple[list[str], list[dict]]:
     """Rule-based keyword matching — the 'symbolic' part of neuro-symbolic."""
-    text_lower = text.lower()
+    if ANY_KEYWORD_RE.search(text) is None:
+        return [], []
+
+    found = {rule for _, rule in KEYWORD_AUTOMATON.iter(text.lower())}
     matched = {}
     trace = []
     
-    for keyword, case_type_ids in LEGAL_KEYWORDS.items():
-        if keyword in text_lower:
-            for ct_id in case_type_ids:
-                if ct_id not in matched:
-                    matched[ct_id] = keyword
-                    trace.append({
-                        "keyword": keyword,
-                        "matched_case_type": ct_id,
-                        "rule": f"Symbolic rule: '{keyword}' → {ct_id}"
-                    })
+    # Apply matched rules in rule order (not text order) so precedence stays stable
+    for rule in sorted(found):
+        keyword, case_type_ids = LEGAL_KEYWORD_RULES[rule]
+        for ct_id in case_type_ids:
+            if ct_id not in matched:
+                matched[ct_id] = keyword
+                trace.append({
+                    "keyword": keyword,
+                    "matched_case_type": ct_id,
+                    "rule": f"Symbolic rule: '{keyword}' → {ct_id}"
+                })
     
     return list(matched.keys()), trace
 
 
+# ─── EMBEDDINGS (Neural Layer) ────────────────────────────────────────────────
+# Must match the model neo4j_import.py used to embed LegalSection nodes
+EMBEDDING_MODEL     = os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+EMBEDDING_CACHE_DIR = os.getenv("EMBEDDING_CACHE_DIR", ".embedding_cache")
+
+embedding_cache = diskcache.Cache(EMBEDDING_CACHE_DIR)
+
+# Cleared the first time the model cannot load or the database turns out to
+# have no sectionVec index; from then on the neural layer goes straight to
+# fulltext (restart the API after importing embeddings to re-enable it)
+_vector_search_available = True
+
+def disable_vector_search(reason) -> None:
+    global _vector_search_available
+    if _vector_search_available:
+        _vector_search_available = False
+        log.warning("Vector search unavailable, using fulltext instead: %s", reason)
+
+@functools.lru_cache(maxsize=1)
+def get_model() -> SentenceTransformer:
+    """Load the model once per process (≈1s and ~100MB); picks CUDA when available."""
+    return SentenceTransformer(EMBEDDING_MODEL)
+
+def embed_text(text: str) -> list[float]:
+    """Normalised embedding of a case description, cached on disk by content hash."""
+    key = f"{EMBEDDING_MODEL}:{hashlib.sha1(text.encode()).hexdigest()}"
+    vector = embedding_cache.get(key)
+    if vector is None:
+        vector = get_model().encode([text], normalize_embeddings=True)[0].tolist()
+        embedding_cache.set(key, vector)
+    return vector
+
+
 # ─── CYPHER QUERIES ───────────────────────────────────────────────────────────
 
-def query_sections_by_case_types(session, case_type_ids: list[str]) -> list[dict]:
+# Query text lives in module constants so every call sends the identical
+# string and Neo4j's plan cache is reused across requests.
+_Q_HEALTH = "RETURN 1"
+
+# Every property the handlers MATCH on gets a uniqueness constraint (and with
+# it a range index), so lookups are index seeks rather than label scans.
+_Q_SCHEMA = (
+    "CREATE CONSTRAINT IF NOT EXISTS FOR (n:LegalSection) REQUIRE n.section_id IS UNIQUE",
+    "CREATE CONSTRAINT IF NOT EXISTS FOR (n:LegalAction)  REQUIRE n.action_id IS UNIQUE",
+    "CREATE CONSTRAINT IF NOT EXISTS FOR (n:CaseType)     REQUIRE n.case_type_id IS UNIQUE",
+    "CREATE CONSTRAINT IF NOT EXISTS FOR (n:Evidence)     REQUIRE n.evidence_id IS UNIQUE",
+    "CREATE CONSTRAINT IF NOT EXISTS FOR (n:Outcome)      REQUIRE n.outcome_id IS UNIQUE",
+    "CREATE FULLTEXT INDEX sectionFulltext IF NOT EXISTS FOR (n:LegalSection) ON EACH [n.section_title, n.layman_explanation, n.embedding_text]",
+)
+# sectionVec is created by neo4j_import.py alongside the embeddings it indexes;
+# its absence is what tells query_semantic_sections to fall back to fulltext.
+
+_Q_SECTIONS_BY_CT = """
+    UNWIND $ids AS ct_id
+    MATCH (s:LegalSection)-[r:MAPS_TO_CASE_TYPE]->(ct:CaseType {case_type_id: ct_id})
+    RETURN DISTINCT
+        s.section_id         AS section_id,
+        s.section_number     AS section_number,
+        s.section_title      AS section_title,
+        s.layman_explanation AS layman_explanation,
+        s.severity_level     AS severity_level,
+        s.cognizable         AS cognizable,
+        s.bailable           AS bailable,
+        s.punishment_summary AS punishment_summary,
+        s.max_punishment_years AS max_punishment_years,
+        r.relevance_score    AS relevance_score,
+        ct.case_type_id      AS case_type_id,
+        ct.scenario_description    AS ct_description,
+        ct.typical_duration_months AS ct_duration,
+        ct.common_mistakes         AS ct_mistakes
+    ORDER BY r.relevance_score DESC
+    LIMIT 10
+"""
+
+_Q_FULLTEXT = """
+    CALL db.index.fulltext.queryNodes('sectionFulltext', $q)
+    YIELD node, score
+    RETURN
+        node.section_id         AS section_id,
+        node.section_number     AS section_number,
+        node.section_title      AS section_title,
+        node.layman_explanation AS layman_explanation,
+        node.severity_level     AS severity_level,
+        node.cognizable         AS cognizable,
+        node.bailable           AS bailable,
+        node.punishment_summary AS punishment_summary,
+        score                   AS relevance_score
+    ORDER BY score DESC
+    LIMIT 5
+"""
+
+_Q_VECTOR = """
+    CALL db.index.vector.queryNodes('sectionVec', 5, $embedding)
+    YIELD node, score
+    RETURN
+        node.section_id         AS section_id,
+        node.section_number     AS section_number,
+        node.section_title      AS section_title,
+        node.layman_explanation AS layman_explanation,
+        node.severity_level     AS severity_level,
+        node.cognizable         AS cognizable,
+        node.bailable           AS bailable,
+        node.punishment_summary AS punishment_summary,
+        score                   AS relevance_score
+    ORDER BY score DESC
+"""
+
+_Q_GRAPH_BUNDLE = """
+    WITH $ids AS ids
+    CALL {
+        WITH ids
+        UNWIND ids AS sid
+        MATCH (s:LegalSection {section_id: sid})-[r:HAS_ACTION]->(a:LegalAction)
+        RETURN collect(DISTINCT {
+            action_id:          a.action_id,
+            action_name:        a.action_name,
+            action_type:        a.action_type,
+            authority_involved: a.authority_involved,
+            cost_min:           a.cost_estimate_min,
+            cost_max:           a.cost_estimate_max,
+            online_possible:    a.online_possible,
+            risk_level:         a.risk_level,
+            procedure_steps:    a.procedure_steps,
+            sequence:           r.action_sequence,
+            conditions:         r.conditions_required
+        }) AS actions
+    }
+    CALL {
+        WITH ids
+        UNWIND ids AS sid
+        MATCH (s:LegalSection {section_id: sid})-[r:REQUIRES_EVIDENCE]->(e:Evidence)
+        RETURN collect(DISTINCT {
+            evidence_id:          e.evidence_id,
+            evidence_name:        e.evidence_name,
+            evidence_type:        e.evidence_type,
+            description:          e.description,
+            legal_weight:         e.legal_weight,
+            evidence_source:      e.evidence_source,
+            storage_requirements: e.storage_requirements,
+            tamper_risk:          e.tamper_risk,
+            necessity_level:      r.necessity_level,
+            how_it_proves:        r.how_it_proves
+        }) AS evidence
+    }
+    CALL {
+        WITH ids
+        UNWIND ids AS sid
+        MATCH (s:LegalSection {section_id: sid})-[:HAS_ACTION]->(a:LegalAction)
+              -[r:LEADS_TO_OUTCOME]->(o:Outcome)
+        RETURN collect(DISTINCT {
+            outcome_id:          o.outcome_id,
+            outcome_description: o.outcome_description,
+            outcome_type:        o.outcome_type,
+            timeline_months:     o.typical_timeline_months,
+            appeal_possible:     o.appeal_possible,
+            precedent_cases:     o.precedent_cases,
+            probability:         r.probability_percentage,
+            influencing_factors: r.influencing_factors
+        }) AS outcomes
+    }
+    RETURN actions, evidence, outcomes
+"""
+
+_Q_RELATED = """
+    UNWIND $ids AS sid
+    MATCH (s:LegalSection {section_id: sid})-[r:RELATED_TO]->(related:LegalSection)
+    RETURN DISTINCT
+        related.section_id    AS section_id,
+        related.section_title AS section_title,
+        r.relationship_type   AS relationship_type,
+        r.explanation         AS explanation
+    LIMIT 10
+"""
+
+# LegalSection projection listing every property except the 384-float
+# `embedding`, which the clients never use and would bloat every response
+_SECTION_PROPS = (
+    "{.section_id, .section_number, .act_name, .chapter_name, .section_title, "
+    ".full_text, .layman_explanation, .category, .severity_level, "
+    ".punishment_summary, .max_punishment_years, .cognizable, .bailable, "
+    ".applicable_states, .is_compoundable, .embedding_text}"
+)
+
+# One pattern comprehension per relationship: no cross product between the
+# neighbour sets and no DISTINCT over maps. Repeated outcome nodes are
+# deduplicated in Python by get_graph's seen_nodes.
+_Q_GRAPH = """
+    MATCH (s:LegalSection {section_id: $id})
+    RETURN
+        s """ + _SECTION_PROPS + """ AS s,
+        [(s)-[r:RELATED_TO]->(n:LegalSection)
+            | {node: n """ + _SECTION_PROPS + """, rel: properties(r), type: type(r)}] AS related_sections,
+        [(s)-[r:HAS_ACTION]->(n:LegalAction)
+            | {node: properties(n), rel: properties(r)}] AS actions,
+        [(s)-[:HAS_ACTION]->(a:LegalAction)-[r:LEADS_TO_OUTCOME]->(n:Outcome)
+            | {node: properties(n), rel: properties(r), from: a.action_id}] AS outcomes,
+        [(s)-[r:REQUIRES_EVIDENCE]->(n:Evidence)
+            | {node: properties(n), rel: properties(r)}] AS evidence,
+        [(s)-[r:MAPS_TO_CASE_TYPE]->(n:CaseType)
+            | {node: properties(n), rel: properties(r)}] AS case_types
+"""
+
+_Q_SECTION = """
+    MATCH (s:LegalSection {section_id: $id})
+    RETURN s """ + _SECTION_PROPS + """ AS s
+"""
+
+_Q_SEARCH = """
+    CALL db.index.fulltext.queryNodes('sectionFulltext', $q)
+    YIELD node, score
+    RETURN
+        node.section_id         AS section_id,
+        node.section_number     AS section_number,
+        node.section_title      AS section_title,
+        node.layman_explanation AS layman_explanation,
+        node.severity_level     AS severity_level,
+        score
+    ORDER BY score DESC
+    LIMIT 10
+"""
+
+WORD_RE = re.compile(r'\b[a-zA-Z]{4,}\b')
+
+async def query_sections_by_case_types(case_type_ids: list[str]) -> tuple[list[dict], list[dict]]:
+    """Sections mapped to the given case types, plus metadata for each case type reached."""
     if not case_type_ids:
-        return []
-    result = session.run("""
-        UNWIND $ids AS ct_id
-        MATCH (s:LegalSection)-[r:MAPS_TO_CASE_TYPE]->(ct:CaseType {case_type_id: ct_id})
-        RETURN DISTINCT
-            s.section_id         AS section_id,
-            s.section_number     AS section_number,
-            s.section_title      AS section_title,
-            s.layman_explanation AS layman_explanation,
-            s.severity_level     AS severity_level,
-            s.cognizable         AS cognizable,
-            s.bailable           AS bailable,
-            s.punishment_summary AS punishment_summary,
-            s.max_punishment_years AS max_punishment_years,
-            r.relevance_score    AS relevance_score,
-            ct.case_type_id      AS case_type_id
-        ORDER BY r.relevance_score DESC
-        LIMIT 10
-    """, ids=case_type_ids)
-    return [dict(r) for r in result]
-
-
-def query_fulltext_sections(session, text: str) -> list[dict]:
+        return [], []
+    async with get_session() as session:
+        result = await session.run(_Q_SECTIONS_BY_CT, ids=case_type_ids)
+        sections = await result.data()
+
+    # Split the ct_* columns off each section row into one entry per case type
+    case_types = {}
+    for s in sections:
+        case_types.setdefault(s["case_type_id"], {
+            "id":          s["case_type_id"],
+            "description": s.pop("ct_description"),
+            "duration":    s.pop("ct_duration"),
+            "mistakes":    s.pop("ct_mistakes"),
+        })
+    return sections, list(case_types.values())
+
+
+async def query_fulltext_sections(text: str) -> list[dict]:
     """Neural layer: fulltext search using Neo4j's built-in fulltext index."""
-    # Extract key phrases (simple NLP preprocessing)
-    words = re.findall(r'\b[a-zA-Z]{4,}\b', text.lower())
-    query_str = " OR ".join(set(words[:8]))  # top 8 unique words
+    # Extract key phrases (simple NLP preprocessing): first 8 unique words
+    words = []
+    seen = set()
+    for m in WORD_RE.finditer(text):
+        w = m.group().lower()
+        if w not in seen:
+            seen.add(w)
+            words.append(w)
+            if len(words) == 8:
+                break
+    query_str = " OR ".join(words)
     
-    result = session.run("""
-        CALL db.index.fulltext.queryNodes('sectionFulltext', $q)
-        YIELD node, score
-        RETURN
-            node.section_id         AS section_id,
-            node.section_number     AS section_number,
-            node.section_title      AS section_title,
-            node.layman_explanation AS layman_explanation,
-            node.severity_level     AS severity_level,
-            node.cognizable         AS cognizable,
-            node.bailable           AS bailable,
-            node.punishment_summary AS punishment_summary,
-            score                   AS relevance_score
-        ORDER BY score DESC
-        LIMIT 5
-    """, q=query_str)
-    return [dict(r) for r in result]
-
-
-def query_action_plan(session, section_ids: list[str]) -> list[dict]:
-    result = session.run("""
-        UNWIND $ids AS sid
-        MATCH (s:LegalSection {section_id: sid})-[r:HAS_ACTION]->(a:LegalAction)
-        RETURN DISTINCT
-            a.action_id          AS action_id,
-            a.action_name        AS action_name,
-            a.action_type        AS action_type,
-            a.authority_involved AS authority_involved,
-            a.cost_estimate_min  AS cost_min,
-            a.cost_estimate_max  AS cost_max,
-            a.online_possible    AS online_possible,
-            a.risk_level         AS risk_level,
-            a.procedure_steps    AS procedure_steps,
-            r.action_sequence    AS sequence,
-            r.conditions_required AS conditions
-        ORDER BY
-            CASE r.action_sequence
-                WHEN 'Primary' THEN 1
-                WHEN 'Secondary' THEN 2
-                WHEN 'Alternative' THEN 3
-                ELSE 4
-            END
-    """, ids=section_ids)
-    return [dict(r) for r in result]
-
-
-def query_evidence_checklist(session, section_ids: list[str]) -> list[dict]:
-    result = session.run("""
-        UNWIND $ids AS sid
-        MATCH (s:LegalSection {section_id: sid})-[r:REQUIRES_EVIDENCE]->(e:Evidence)
-        RETURN DISTINCT
-            e.evidence_id           AS evidence_id,
-            e.evidence_name         AS evidence_name,
-            e.evidence_type         AS evidence_type,
-            e.description           AS description,
-            e.legal_weight          AS legal_weight,
-            e.evidence_source       AS evidence_source,
-            e.storage_requirements  AS storage_requirements,
-            e.tamper_risk           AS tamper_risk,
-            r.necessity_level       AS necessity_level,
-            r.how_it_proves         AS how_it_proves
-        ORDER BY
-            CASE r.necessity_level
-                WHEN 'Must-have'  THEN 1
-                WHEN 'Good-to-have' THEN 2
-                ELSE 3
-            END
-    """, ids=section_ids)
-    return [dict(r) for r in result]
-
-
-def query_outcome_probabilities(session, action_ids: list[str]) -> list[dict]:
-    if not action_ids:
-        return []
-    result = session.run("""
-        UNWIND $ids AS aid
-        MATCH (a:LegalAction {action_id: aid})-[r:LEADS_TO_OUTCOME]->(o:Outcome)
-        RETURN DISTINCT
-            o.outcome_id          AS outcome_id,
-            o.outcome_description AS outcome_description,
-            o.outcome_type        AS outcome_type,
-            o.typical_timeline_months AS timeline_months,
-            o.appeal_possible     AS appeal_possible,
-            o.precedent_cases     AS precedent_cases,
-            r.probability_percentage AS probability,
-            r.influencing_factors AS influencing_factors
-        ORDER BY r.probability_percentage DESC
-        LIMIT 8
-    """, ids=action_ids)
-    return [dict(r) for r in result]
-
-
-def query_related_sections(session, section_ids: list[str]) -> list[dict]:
-    result = session.run("""
-        UNWIND $ids AS sid
-        MATCH (s:LegalSection {section_id: sid})-[r:RELATED_TO]->(related:LegalSection)
-        RETURN DISTINCT
-            related.section_id    AS section_id,
-            related.section_title AS section_title,
-            r.relationship_type   AS relationship_type,
-            r.explanation         AS explanation
-        LIMIT 10
-    """, ids=section_ids)
-    return [dict(r) for r in result]
+    async with get_session() as session:
+        result = await session.run(_Q_FULLTEXT, q=query_str)
+        return await result.data()
+
+
+async def query_semantic_sections(text: str) -> tuple[list[dict], str]:
+    """
+    Neural layer: nearest sections by embedding similarity (sectionVec index).
+    Returns (sections, source), source being "vector" or "fulltext" when the
+    database has no sectionVec index or no embeddings stored yet.
+    """
+    rows = []
+    if _vector_search_available:
+        try:
+            embedding = await asyncio.to_thread(embed_text, text)
+        except Exception as e:
+            # Encoder failure only costs this request its vector search
+            log.warning("Embedding failed, falling back to fulltext: %s", e)
+        else:
+            try:
+                async with get_session() as session:
+                    result = await session.run(_Q_VECTOR, embedding=embedding)
+                    rows = await result.data()
+            except ClientError as e:
+                # Databases imported without embeddings have no sectionVec index
+                disable_vector_search(e)
+    if rows:
+        return rows, "vector"
+    return await query_fulltext_sections(text), "fulltext"
+
+
+# Sort keys for the bundle collections (previously CASE expressions in ORDER BY)
+_SEQUENCE_RANK  = {"Primary": 1, "Secondary": 2, "Alternative": 3}
+_NECESSITY_RANK = {"Must-have": 1, "Good-to-have": 2}
+
+def rank_rows(rows: list[dict], field: str, ranks: dict[str, int], limit: int) -> list[dict]:
+    """Stable in-place sort on a categorical field (unranked values last), then truncate."""
+    unranked = len(ranks) + 1
+    rows.sort(key=lambda r: ranks.get(r[field], unranked))
+    return rows[:limit]
+
+
+async def query_graph_bundle(section_ids: list[str]) -> tuple[list[dict], list[dict], list[dict]]:
+    """
+    Action plan, evidence checklist and outcome probabilities for a set of
+    sections, fetched in a single round-trip. Each CALL subquery aggregates
+    on its own so the three collections never form a cross product.
+    """
+    async with get_session() as session:
+        result = await session.run(_Q_GRAPH_BUNDLE, ids=section_ids)
+        record = await result.single()
+
+    actions = rank_rows(record["actions"], "sequence", _SEQUENCE_RANK, 25)
+    evidence = rank_rows(record["evidence"], "necessity_level", _NECESSITY_RANK, 25)
+    outcomes = sorted(record["outcomes"], key=lambda o: o["probability"] or 0, reverse=True)[:8]
+    return actions, evidence, outcomes
+
+
+async def query_related_sections(section_ids: list[str]) -> list[dict]:
+    async with get_session() as session:
+        result = await session.run(_Q_RELATED, ids=section_ids)
+        return await result.data()
 
 
 # ─── ENDPOINTS ────────────────────────────────────────────────────────────────
 
 @app.get("/health")
-def health():
+async def health(session: AsyncSession = Depends(db)):
     try:
-        with get_session() as s:
-            s.run("RETURN 1")
+        result = await session.run(_Q_HEALTH)
+        await result.consume()
         return {"status": "ok", "database": "connected"}
     except Exception as e:
         raise HTTPException(503, f"Database unreachable: {e}")
 
 
-@app.post("/analyze", response_model=AnalyzeResponse)
-def analyze_case(req: AnalyzeRequest):
+@app.post("/analyze", responses={200: {"model": AnalyzeResponse}})
+async def analyze_case(req: AnalyzeRequest):
     """
     Main endpoint. Takes a case description, runs neuro-symbolic reasoning,
     returns matched sections, actions, evidence, outcomes + full reasoning trace.
     """
+    cache_key = analyze_cache_key(req)
+    cached = _ANALYZE_CACHE.get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached, headers={"Cache-Control": CACHE_CONTROL})
+
     reasoning_trace = []
     step = 1
 
     # ── Symbolic layer: keyword matching ──────────────────────────────────────
     symbolic_case_types, symbolic_trace = extract_case_types_symbolically(req.case_description)
-    reasoning_trace.append(ReasoningStep(
+    reasoning_trace.append(dict(
         step=step, type="symbolic",
         description="Keyword-based rule matching against legal case type definitions",
         result=f"Matched case types: {symbolic_case_types or ['none yet — using neural fallback']}"
     ))
     step += 1
 
-    with get_session() as session:
-
-        # ── Graph traversal: find sections from symbolic case types ───────────
-        symbolic_sections = query_sections_by_case_types(session, symbolic_case_types)
-        reasoning_trace.append(ReasoningStep(
-            step=step, type="graph_traversal",
-            description="Neo4j traversal: CaseType → MAPS_TO_CASE_TYPE → LegalSection",
-            result=f"Found {len(symbolic_sections)} sections via symbolic path"
-        ))
-        step += 1
-
-        # ── Neural layer: fulltext search for additional matches ──────────────
-        neural_sections = query_fulltext_sections(session, req.case_description)
-        reasoning_trace.append(ReasoningStep(
-            step=step, type="neural",
-            description="Neo4j fulltext index search on section titles and explanations",
-            result=f"Found {len(neural_sections)} sections via neural/semantic path"
-        ))
-        step += 1
-
-        # ── Merge & deduplicate sections (symbolic + neural) ──────────────────
-        seen_ids = set()
-        all_sections = []
-        for s in symbolic_sections + neural_sections:
-            if s["section_id"] not in seen_ids:
-                seen_ids.add(s["section_id"])
-                all_sections.append(s)
-
-        # Apply symbolic filter: state-specific sections
-        if req.state and req.state != "All India":
-            # Keep sections that apply to requested state or All India
-            # (for now: pass-through since most are All India)
-            pass
-
-        reasoning_trace.append(ReasoningStep(
-            step=step, type="symbolic",
-            description="Deduplication + symbolic filters (state, category)",
-            result=f"{len(all_sections)} unique sections after merge"
-        ))
-        step += 1
-
-        section_ids = [s["section_id"] for s in all_sections]
-
-        # ── Graph traversal: get action plan ──────────────────────────────────
-        action_plan = query_action_plan(session, section_ids)
-        reasoning_trace.append(ReasoningStep(
-            step=step, type="graph_traversal",
-            description="Neo4j traversal: LegalSection → HAS_ACTION → LegalAction (ordered by sequence)",
-            result=f"Generated {len(action_plan)}-step action plan"
-        ))
-        step += 1
-
-        # ── Graph traversal: get evidence checklist ───────────────────────────
-        evidence = query_evidence_checklist(session, section_ids)
-        reasoning_trace.append(ReasoningStep(
-            step=step, type="graph_traversal",
-            description="Neo4j traversal: LegalSection → REQUIRES_EVIDENCE → Evidence (ordered by necessity)",
-            result=f"Found {len(evidence)} evidence items ({sum(1 for e in evidence if e['necessity_level']=='Must-have')} must-have)"
-        ))
-        step += 1
-
-        # ── Graph traversal: get outcome probabilities ─────────────────────────
-        action_ids = [a["action_id"] for a in action_plan]
-        outcomes = query_outcome_probabilities(session, action_ids)
-        reasoning_trace.append(ReasoningStep(
-            step=step, type="graph_traversal",
-            description="Neo4j traversal: LegalAction → LEADS_TO_OUTCOME → Outcome (with probability scores)",
-            result=f"Computed {len(outcomes)} probable outcomes"
-        ))
-        step += 1
-
-        # ── Unique case types from matched sections ────────────────────────────
-        case_type_ids_found = list({s.get("case_type_id") for s in symbolic_sections if s.get("case_type_id")})
-        case_types = []
-        if case_type_ids_found:
-            ct_result = session.run("""
-                UNWIND $ids AS id
-                MATCH (ct:CaseType {case_type_id: id})
-                RETURN ct.case_type_id AS id, ct.scenario_description AS description,
-                       ct.typical_duration_months AS duration, ct.common_mistakes AS mistakes
-            """, ids=case_type_ids_found)
-            case_types = [dict(r) for r in ct_result]
-
-        # ── Confidence score (symbolic: 0.7 weight, neural: 0.3 weight) ───────
-        symbolic_hits = len(symbolic_sections)
-        neural_hits   = len(neural_sections)
-        confidence = min(1.0, round((symbolic_hits * 0.7 + neural_hits * 0.3) / 10, 2))
-
-        reasoning_trace.append(ReasoningStep(
-            step=step, type="symbolic",
-            description="Confidence scoring: weighted average of symbolic + neural hit rates",
-            result=f"Overall confidence: {confidence * 100:.0f}%"
-        ))
-
-    return AnalyzeResponse(
-        case_description=req.case_description,
-        matched_sections=all_sections,
-        case_types=case_types,
-        action_plan=action_plan,
-        evidence_checklist=evidence,
-        outcome_probabilities=outcomes,
-        reasoning_trace=reasoning_trace,
-        confidence_score=confidence
-    )
+    # The neural search has no dependency on the symbolic path — start it now
+    neural_task = asyncio.create_task(query_semantic_sections(req.case_description))
+
+    # ── Graph traversal: find sections from symbolic case types ───────────────
+    symbolic_sections, case_types = await query_sections_by_case_types(symbolic_case_types)
+    reasoning_trace.append(dict(
+        step=step, type="graph_traversal",
+        description="Neo4j traversal: CaseType → MAPS_TO_CASE_TYPE → LegalSection",
+        result=f"Found {len(symbolic_sections)} sections via symbolic path"
+    ))
+    step += 1
+
+    # ── Neural layer: semantic search for additional matches ──────────────────
+    neural_sections, neural_source = await neural_task
+    reasoning_trace.append(dict(
+        step=step, type="neural",
+        description=(f"Vector similarity search ({EMBEDDING_MODEL}) over section embeddings"
+                     if neural_source == "vector" else
+                     "Fulltext search over section text (no section embeddings available)"),
+        result=f"Found {len(neural_sections)} sections via neural/semantic path"
+    ))
+    step += 1
+
+    # ── Merge & deduplicate sections (symbolic + neural) ──────────────────────
+    # First occurrence wins, so symbolic rows take precedence over neural ones
+    merged = {}
+    for s in symbolic_sections:
+        merged.setdefault(s["section_id"], s)
+    for s in neural_sections:
+        merged.setdefault(s["section_id"], s)
+    all_sections = list(merged.values())
+
+    # Apply symbolic filter: state-specific sections
+    if req.state and req.state != "All India":
+        # Keep sections that apply to requested state or All India
+        # (for now: pass-through since most are All India)
+        pass
+
+    reasoning_trace.append(dict(
+        step=step, type="symbolic",
+        description="Deduplication + symbolic filters (state, category)",
+        result=f"{len(all_sections)} unique sections after merge"
+    ))
+    step += 1
+
+    section_ids = [s["section_id"] for s in all_sections]
+
+    # ── Graph traversal: actions, evidence, outcomes in one round-trip ────────
+    action_plan, evidence, outcomes = await query_graph_bundle(section_ids)
+
+    # ── Graph traversal: get action plan ──────────────────────────────────────
+    reasoning_trace.append(dict(
+        step=step, type="graph_traversal",
+        description="Neo4j traversal: LegalSection → HAS_ACTION → LegalAction (ordered by sequence)",
+        result=f"Generated {len(action_plan)}-step action plan"
+    ))
+    step += 1
+
+    # ── Graph traversal: get evidence checklist ───────────────────────────────
+    reasoning_trace.append(dict(
+        step=step, type="graph_traversal",
+        description="Neo4j traversal: LegalSection → REQUIRES_EVIDENCE → Evidence (ordered by necessity)",
+        result=f"Found {len(evidence)} evidence items ({sum(1 for e in evidence if e['necessity_level']=='Must-have')} must-have)"
+    ))
+    step += 1
+
+    # ── Graph traversal: get outcome probabilities ─────────────────────────────
+    reasoning_trace.append(dict(
+        step=step, type="graph_traversal",
+        description="Neo4j traversal: LegalAction → LEADS_TO_OUTCOME → Outcome (with probability scores)",
+        result=f"Computed {len(outcomes)} probable outcomes"
+    ))
+    step += 1
+
+    # ── Confidence score (symbolic: 0.7 weight, neural: 0.3 weight) ───────────
+    symbolic_hits = len(symbolic_sections)
+    neural_hits   = len(neural_sections)
+    confidence = min(1.0, round((symbolic_hits * 0.7 + neural_hits * 0.3) / 10, 2))
+
+    reasoning_trace.append(dict(
+        step=step, type="symbolic",
+        description="Confidence scoring: weighted average of symbolic + neural hit rates",
+        result=f"Overall confidence: {confidence * 100:.0f}%"
+    ))
+
+    result = {
+        "case_description":      req.case_description,
+        "matched_sections":      all_sections,
+        "case_types":            case_types,
+        "action_plan":           action_plan,
+        "evidence_checklist":    evidence,
+        "outcome_probabilities": outcomes,
+        "reasoning_trace":       reasoning_trace,
+        "confidence_score":      confidence,
+    }
+    _ANALYZE_CACHE[cache_key] = result
+    return ORJSONResponse(result, headers={"Cache-Control": CACHE_CONTROL})
 
 
 @app.get("/graph/{section_id}")
-def get_graph(section_id: str):
+async def get_graph(section_id: str, response: Response,
+                    session: AsyncSession = Depends(db)):
     """
     Returns graph JSON (nodes + edges) for a section.
     Used by the React graph visualizer (react-force-graph / vis.js).
     """
-    with get_session() as session:
-        result = session.run("""
-            MATCH (s:LegalSection {section_id: $id})
-            
-            OPTIONAL MATCH (s)-[r1:RELATED_TO]->(s2:LegalSection)
-            OPTIONAL MATCH (s)-[r2:HAS_ACTION]->(a:LegalAction)
-            OPTIONAL MATCH (a)-[r3:LEADS_TO_OUTCOME]->(o:Outcome)
-            OPTIONAL MATCH (s)-[r4:REQUIRES_EVIDENCE]->(ev:Evidence)
-            OPTIONAL MATCH (s)-[r5:MAPS_TO_CASE_TYPE]->(ct:CaseType)
-
-            RETURN
-                s,
-                collect(DISTINCT {node: s2, rel: r1}) AS related_sections,
-                collect(DISTINCT {node: a,  rel: r2}) AS actions,
-                collect(DISTINCT {node: o,  rel: r3}) AS outcomes,
-                collect(DISTINCT {node: ev, rel: r4}) AS evidence,
-                collect(DISTINCT {node: ct, rel: r5}) AS case_types
-        """, id=section_id)
-
-        record = result.single()
-        if not record:
-            raise HTTPException(404, f"Section {section_id} not found")
-
-        nodes = []
-        edges = []
-        seen_nodes = set()
-
-        def add_node(node_id, label, node_type, data=None):
-            if node_id not in seen_nodes:
-                seen_nodes.add(node_id)
-                nodes.append({"id": node_id, "label": label, "type": node_type, "data": data or {}})
-
-        # Root section
-        s = record["s"]
-        add_node(s["section_id"], s["section_number"], "LegalSection", dict(s))
-
-        # Related sections
-        for item in record["related_sections"]:
-            n = item["node"]
-            if n:
-                add_node(n["section_id"], n["section_number"], "LegalSection", dict(n))
-                edges.append({"from": section_id, "to": n["section_id"],
-                               "label": item["rel"].type, "data": dict(item["rel"])})
-
-        # Actions
-        for item in record["actions"]:
-            n = item["node"]
-            if n:
-                add_node(n["action_id"], n["action_name"][:30], "LegalAction", dict(n))
-                edges.append({"from": section_id, "to": n["action_id"],
-                               "label": "HAS_ACTION", "data": dict(item["rel"])})
-
-        # Outcomes
-        for item in record["outcomes"]:
-            n = item["node"]
-            if n:
-                add_node(n["outcome_id"], n["outcome_description"][:30], "Outcome", dict(n))
-                action_id = item["rel"].start_node["action_id"] if hasattr(item["rel"], "start_node") else None
-                if action_id:
-                    edges.append({"from": action_id, "to": n["outcome_id"],
-                                   "label": "LEADS_TO", "data": dict(item["rel"])})
-
-        # Evidence
-        for item in record["evidence"]:
-            n = item["node"]
-            if n:
-                add_node(n["evidence_id"], n["evidence_name"][:30], "Evidence", dict(n))
-                edges.append({"from": section_id, "to": n["evidence_id"],
-                               "label": "REQUIRES", "data": dict(item["rel"])})
-
-        # Case types
-        for item in record["case_types"]:
-            n = item["node"]
-            if n:
-                add_node(n["case_type_id"], n["case_type_id"], "CaseType", dict(n))
-                edges.append({"from": section_id, "to": n["case_type_id"],
-                               "label": "MAPS_TO", "data": dict(item["rel"])})
-
-    return {"nodes": nodes, "edges": edges, "root": section_id}
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    cached = _GRAPH_CACHE.get(section_id)
+    if cached is not None:
+        return cached
+
+    result = await session.run(_Q_GRAPH, id=section_id)
+
+    record = await result.single()
+    if not record:
+        raise HTTPException(404, f"Section {section_id} not found")
+
+    nodes = []
+    edges = []
+    seen_nodes = set()
+
+    def add_node(node_id, label, node_type, data=None):
+        if node_id not in seen_nodes:
+            seen_nodes.add(node_id)
+            nodes.append({"id": node_id, "label": label, "type": node_type, "data": data or {}})
+
+    # Root section
+    s = record["s"]
+    add_node(s["section_id"], s["section_number"], "LegalSection", s)
+
+    # Related sections
+    for item in record["related_sections"]:
+        n = item["node"]
+        if n:
+            add_node(n["section_id"], n["section_number"], "LegalSection", n)
+            edges.append({"from": section_id, "to": n["section_id"],
+                           "label": item["type"], "data": item["rel"]})
+
+    # Actions
+    for item in record["actions"]:
+        n = item["node"]
+        if n:
+            add_node(n["action_id"], n["action_name"][:30], "LegalAction", n)
+            edges.append({"from": section_id, "to": n["action_id"],
+                           "label": "HAS_ACTION", "data": item["rel"]})
+
+    # Outcomes
+    for item in record["outcomes"]:
+        n = item["node"]
+        if n:
+            add_node(n["outcome_id"], n["outcome_description"][:30], "Outcome", n)
+            action_id = item["from"]
+            if action_id:
+                edges.append({"from": action_id, "to": n["outcome_id"],
+                               "label": "LEADS_TO", "data": item["rel"]})
+
+    # Evidence
+    for item in record["evidence"]:
+        n = item["node"]
+        if n:
+            add_node(n["evidence_id"], n["evidence_name"][:30], "Evidence", n)
+            edges.append({"from": section_id, "to": n["evidence_id"],
+                           "label": "REQUIRES", "data": item["rel"]})
+
+    # Case types
+    for item in record["case_types"]:
+        n = item["node"]
+        if n:
+            add_node(n["case_type_id"], n["case_type_id"], "CaseType", n)
+            edges.append({"from": section_id, "to": n["case_type_id"],
+                           "label": "MAPS_TO", "data": item["rel"]})
+
+    graph = {"nodes": nodes, "edges": edges, "root": section_id}
+    _GRAPH_CACHE[section_id] = graph
+    return graph
 
 
 @app.get("/section/{section_id}")
-def get_section(section_id: str):
-    with get_session() as session:
-        result = session.run("""
-            MATCH (s:LegalSection {section_id: $id})
-            RETURN s
-        """, id=section_id)
-        record = result.single()
-        if not record:
-            raise HTTPException(404, f"Section {section_id} not found")
-        return dict(record["s"])
+async def get_section(section_id: str, response: Response,
+                      session: AsyncSession = Depends(db)):
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    cached = _SECTION_CACHE.get(section_id)
+    if cached is not None:
+        return cached
+
+    result = await session.run(_Q_SECTION, id=section_id)
+    record = await result.single()
+    if not record:
+        raise HTTPException(404, f"Section {section_id} not found")
+    section = record["s"]
+    _SECTION_CACHE[section_id] = section
+    return section
 
 
 @app.get("/search")
-def search_sections(q: str = Query(..., min_length=3)):
-    with get_session() as session:
-        results = session.run("""
-            CALL db.index.fulltext.queryNodes('sectionFulltext', $q)
-            YIELD node, score
-            RETURN
-                node.section_id         AS section_id,
-                node.section_number     AS section_number,
-                node.section_title      AS section_title,
-                node.layman_explanation AS layman_explanation,
-                node.severity_level     AS severity_level,
-                score
-            ORDER BY score DESC
-            LIMIT 10
-        """, q=q)
-        return {"results": [dict(r) for r in results]}
-
-
-@app.on_event("shutdown")
-def shutdown():
-    driver.close()
+async def search_sections(q: str = Query(..., min_length=3),
+                          session: AsyncSession = Depends(db)):
+    results = await session.run(_Q_SEARCH, q=q)
+    return {"results": await results.data()}
+
+
+# ─── LIFECYCLE ────────────────────────────────────────────────────────────────
+
+async def ensure_schema():
+    async with get_session() as session:
+        for q in _Q_SCHEMA:
+            try:
+                result = await session.run(q)
+                await result.consume()
+            except Exception as e:
+                log.warning("Schema statement skipped (%s): %s", q, e)
+
+
+async def warm_up():
+    """Load the model, the page cache and every query plan before traffic arrives."""
+    warmups = [
+        ("CALL apoc.warmup.run(true, true, true)", {}),
+        (_Q_SECTIONS_BY_CT, {"ids": []}),
+        (_Q_FULLTEXT,       {"q": "warmup"}),
+        (_Q_VECTOR,         {"embedding": [1.0] + [0.0] * 383}),
+        (_Q_GRAPH_BUNDLE,   {"ids": []}),
+        (_Q_RELATED,        {"ids": []}),
+        (_Q_GRAPH,          {"id": ""}),
+        (_Q_SECTION,        {"id": ""}),
+        (_Q_SEARCH,         {"q": "warmup"}),
+    ]
+    try:
+        await asyncio.to_thread(get_model)
+    except Exception as e:
+        # e.g. offline first boot: serve with the fulltext fallback instead
+        disable_vector_search(e)
+    async with get_session() as session:
+        for q, params in warmups:
+            try:
+                result = await session.run(q, params)
+                await result.consume()
+            except Exception as e:
+                # apoc.warmup.run needs APOC (and is gone from APOC 5 core)
+                log.warning("Warm-up query skipped: %s", e)
+
@@ -11,35 +11,321 @@ Relationship types:
   (LegalSection)-[:MAPS_TO_CASE_TYPE {relevance_score, conditions, exceptions}]->(CaseType)
   (LegalAction)-[:LEADS_TO_OUTCOME {probability_pct, influencing_factors}]->(Outcome)
 
+LegalSection nodes also get an `embedding` vector (from embedding_text) and a
+`sectionVec` vector index, used by the API's neural layer.
+
 Requirements:
-  pip install neo4j pandas
+  pip install neo4j pyarrow sentence-transformers
 """
 
-import pandas as pd
-from neo4j import GraphDatabase
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+from neo4j import READ_ACCESS, WRITE_ACCESS, AsyncGraphDatabase, GraphDatabase
+from neo4j.exceptions import ClientError
+from sentence_transformers import SentenceTransformer
+import asyncio
+import csv
 import os
+import shutil
+import subprocess
+import sys
 
 # ─── CONFIG ───────────────────────────────────────────────────────────────────
 NEO4J_URI      = "bolt://localhost:7687"   # Change to your Neo4j URI
 NEO4J_USER     = "neo4j"
 NEO4J_PASSWORD = "your_password_here"      # ← Set your password
+NEO4J_DATABASE = "neo4j"
 
 # Path to your CSV files (change this to wherever you store them)
 DATA_DIR = "./data"   # Put all 10 CSVs in a folder called 'data'
 
-# ─── CONNECTION ───────────────────────────────────────────────────────────────
-driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD))
+# Rows per UNWIND transaction; raise towards ~100k for very large CSVs
+BATCH_SIZE = 5000
+
+# Bytes of CSV parsed per Arrow record batch; bounds peak memory on big files
+CSV_BLOCK_SIZE = 32 << 20
+
+# Quoted cells may span lines (e.g. full_text), so block boundaries must be
+# found by the quote-aware parser rather than at the next newline
+CSV_PARSE_OPTIONS = pacsv.ParseOptions(newlines_in_values=True)
+
+# Node labels are disjoint, so their importers run concurrently on the async
+# driver (one session each, batches in flight together under asyncio.gather).
+# Relationship importers stay sequential: they lock the same LegalSection
+# endpoints and would deadlock each other.
+
+# Driver tuning for a bulk load. At most six sessions are open at once, so 32
+# connections is ample; waiting up to ACQUISITION_TIMEOUT_S for a free one
+# fails a stalled import instead of hanging it; connections live for the whole
+# load (no reconnects mid-import) and TCP keep-alive stops idle ones being
+# dropped while a large batch is prepared; FETCH_SIZE records per PULL cuts
+# round-trips on any query that does return rows.
+MAX_POOL_SIZE         = 32
+ACQUISITION_TIMEOUT_S = 120
+MAX_CONN_LIFETIME_S   = 3600
+KEEP_ALIVE            = True
+FETCH_SIZE            = 10_000
+
+# How long execute_write keeps retrying TransientErrors (deadlocks, lock
+# timeouts, leader switches) with exponential backoff before giving up
+MAX_RETRY_TIME_S = 60
+
+# True for a first load into an empty database: nodes are written with
+# CREATE ... SET n = row (CSV headers match the property names, the uniqueness
+# constraints reject any duplicate id) and relationships with CREATE, skipping
+# MERGE's existence check and endpoint locks (import_csv's dedup_key keeps that
+# safe). Set False to re-import over existing data: everything is MERGEd, so
+# nothing is duplicated. The import refuses to start if this is True and the
+# database already holds graph nodes.
+INITIAL_LOAD = True
+REL_WRITE    = "CREATE" if INITIAL_LOAD else "MERGE"
+
+# Relationship files with at least this many (deduplicated) rows are handed to
+# apoc.periodic.iterate, which batches them server-side (optionally on several
+# worker threads) instead of one client round-trip per BATCH_SIZE rows
+APOC_ITERATE_MIN_ROWS = 100_000
+APOC_BATCH_SIZE       = 1000
+
+# Relationship CSVs of at least LOAD_CSV_MIN_ROWS rows skip Python entirely:
+# they are copied into the server's import directory (set this to its local
+# path, e.g. $NEO4J_HOME/import; None disables the path) and streamed with
+# LOAD CSV ... CALL {} IN TRANSACTIONS. Raise server.import.csv.buffer_size
+# in neo4j.conf if any field is longer than its 2 MB default.
+LOAD_CSV_IMPORT_DIR = None
+LOAD_CSV_MIN_ROWS   = 100_000
+LOAD_CSV_BATCH_SIZE = 10_000
+
+# Offline cold-start path (python neo4j_import.py --admin): header + data CSVs
+# are written here and loaded by neo4j-admin into a stopped, empty database
+ADMIN_IMPORT_DIR = "./admin_import"
+ADMIN_DATABASE   = NEO4J_DATABASE
+NEO4J_ADMIN      = "neo4j-admin"
+
+# Sentence embedding model for LegalSection.embedding (main.py must use the same)
+EMBEDDING_MODEL      = "all-MiniLM-L6-v2"
+EMBEDDING_DIM        = 384
+EMBEDDING_BATCH_SIZE = 32
 
-def run(query, params=None):
-    with driver.session() as session:
-        session.run(query, params or {})
+# ─── CONNECTION ───────────────────────────────────────────────────────────────
+DRIVER_KW = dict(
+    auth=(NEO4J_USER, NEO4J_PASSWORD),
+    max_connection_pool_size=MAX_POOL_SIZE,
+    connection_acquisition_timeout=ACQUISITION_TIMEOUT_S,
+    max_connection_lifetime=MAX_CONN_LIFETIME_S,
+    keep_alive=KEEP_ALIVE,
+    fetch_size=FETCH_SIZE,
+    max_transaction_retry_time=MAX_RETRY_TIME_S,
+)
+driver = GraphDatabase.driver(NEO4J_URI, **DRIVER_KW)
+# CSV imports go through the async driver; schema, embeddings and verification
+# are a handful of sequential queries and keep the blocking one
+async_driver = AsyncGraphDatabase.driver(NEO4J_URI, **DRIVER_KW)
+
+# Naming the database and access mode up front spares each new session the
+# home-database lookup and lets cluster routing pick a writer (or, for the
+# verification reads, a follower) straight away
+SESSION_KW      = {"database": NEO4J_DATABASE, "default_access_mode": WRITE_ACCESS}
+READ_SESSION_KW = {**SESSION_KW, "default_access_mode": READ_ACCESS}
+
+def run_chunked(query, rows, batch_size=BATCH_SIZE):
+    """Run an UNWIND $rows query in bounded write transactions on one session."""
+    with driver.session(**SESSION_KW) as session:
+        for i in range(0, len(rows), batch_size):
+            chunk = rows[i:i + batch_size]
+            session.execute_write(lambda tx: tx.run(query, rows=chunk).consume())
+
+async def write_rows(tx, query, rows):
+    result = await tx.run(query, rows=rows)
+    await result.consume()
+
+async def run_chunked_async(session, query, rows, batch_size=BATCH_SIZE):
+    """Async run_chunked: awaits each bounded write transaction on `session`."""
+    for i in range(0, len(rows), batch_size):
+        chunk = rows[i:i + batch_size]
+        await session.execute_write(write_rows, query, chunk)
+
+async def run_apoc_iterate(session, inner_cypher, rows, batch_size=APOC_BATCH_SIZE, parallel=False):
+    """
+    Run `inner_cypher` (which sees each input as `row`) over `rows` through
+    apoc.periodic.iterate, committing every `batch_size` rows server-side.
+    Must be an auto-commit query: the procedure opens its own transactions.
+    """
+    query = """
+    CALL apoc.periodic.iterate(
+      'UNWIND $rows AS row RETURN row',
+      $inner,
+      {batchSize: $batch_size, parallel: $parallel, retries: 3, params: {rows: $rows}}
+    )
+    YIELD failedBatches, errorMessages
+    RETURN failedBatches, errorMessages
+    """
+    result = await session.run(query, inner=inner_cypher, rows=rows,
+                               batch_size=batch_size, parallel=parallel)
+    record = await result.single()
+    if record["failedBatches"]:
+        raise RuntimeError(f"apoc.periodic.iterate: {record['failedBatches']} batches failed: "
+                           f"{record['errorMessages']}")
+
+# Column casts run on whole Arrow columns before rows are built, so rows reach
+# Bolt as typed PackStream values and the Cypher can SET them directly (same
+# results as toIntegerOrNull/toFloatOrNull: non-numeric text such as
+# max_punishment_years = "Life" becomes null, padding is ignored, ints truncate
+# like int(float(v)) and ints outside the int64 range become null)
+NUMERIC_RE = r"^[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?$"
+
+# Cypher equivalents of the casts, for rows LOAD CSV reads as strings
+CYPHER_CASTS = {pa.int64(): "toIntegerOrNull", pa.float64(): "toFloatOrNull", pa.string(): "toString"}
+
+def cast_column(col, to_type):
+    """
+    Cast a text column (read_csv_batches reads every column as string) to
+    int64 / float64 / string, nulling values that are not numbers.
+    """
+    if pa.types.is_string(to_type):
+        return col
+    col = pc.utf8_trim_whitespace(col)   # float parsing rejects " 5" / "5 "
+    col = pc.if_else(pc.match_substring_regex(col, NUMERIC_RE), col, pa.scalar(None, pa.string()))
+    floats = pc.cast(col, pa.float64())
+    if pa.types.is_integer(to_type):
+        # safe=False would wrap e.g. "1e30" to -2**63 rather than fail
+        in_range = pc.and_(pc.greater_equal(floats, -2.0 ** 63), pc.less(floats, 2.0 ** 63))
+        floats = pc.if_else(in_range, floats, pa.scalar(None, pa.float64()))
+    return pc.cast(floats, to_type, safe=False)
+
+def read_csv_batches(filename, casts=None):
+    """
+    Stream a CSV from DATA_DIR as lists of row dicts, one per Arrow record batch.
+    `casts` maps column name → Arrow type, applied per column before conversion.
+    """
+    path = os.path.join(DATA_DIR, filename)
+    # Arrow infers types from the first block only and then fails on any later
+    # block that breaks the guess (e.g. "Life" among numbers), so every column
+    # is read as text; `casts` types the numeric ones
+    with open(path, newline="", encoding="utf-8") as f:
+        columns = next(csv.reader(f))
+    reader = pacsv.open_csv(path,
+                            read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+                            parse_options=CSV_PARSE_OPTIONS,
+                            convert_options=pacsv.ConvertOptions(
+                                column_types={c: pa.string() for c in columns},
+                                strings_can_be_null=True))
+    for batch in reader:
+        for col, to_type in (casts or {}).items():
+            i = batch.schema.get_field_index(col)
+            batch = batch.set_column(i, col, cast_column(batch.column(i), to_type))
+        yield batch.to_pylist()   # blank / NA cells come through as None
+
+def count_csv_rows(filename):
+    """Cheap row estimate (newlines minus header) without parsing the CSV."""
+    lines = 0
+    with open(os.path.join(DATA_DIR, filename), "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            lines += block.count(b"\n")
+    return max(lines - 1, 0)
+
+async def import_via_load_csv(session, csv_filename, cypher_body, casts=None):
+    """
+    Copy a CSV into LOAD_CSV_IMPORT_DIR and let the server stream it through
+    `cypher_body` (which sees each line as `row`) in its own transactions.
+    `casts` maps column name → Cypher function applied first. Returns the row count.
+    """
+    shutil.copy(os.path.join(DATA_DIR, csv_filename),
+                os.path.join(LOAD_CSV_IMPORT_DIR, csv_filename))
+    overrides = "".join(f", {col}: {fn}(line.{col})" for col, fn in (casts or {}).items())
+    query = f"""
+    LOAD CSV WITH HEADERS FROM $url AS line
+    WITH line {{.*{overrides}}} AS row
+    CALL {{
+      WITH row
+      {cypher_body}
+    }} IN TRANSACTIONS OF {LOAD_CSV_BATCH_SIZE} ROWS
+    RETURN count(*) AS rows
+    """
+    result = await session.run(query, url=f"file:///{csv_filename}")
+    record = await result.single()
+    return record["rows"]
+
+def check_initial_load():
+    """Stop before writing anything if INITIAL_LOAD would CREATE over existing data."""
+    if not INITIAL_LOAD:
+        return
+    with driver.session(**READ_SESSION_KW) as session:
+        existing = session.run(
+            "MATCH (n) WHERE n:LegalSection OR n:LegalAction OR n:CaseType "
+            "OR n:Evidence OR n:Outcome RETURN 1 LIMIT 1"
+        ).single() is not None
+    if existing:
+        sys.exit("Database already holds legal-graph nodes. Set INITIAL_LOAD = False "
+                 "in neo4j_import.py to re-import (MERGE) without duplicates.")
+
+def node_query(label, key):
+    """
+    UNWIND query writing each row as a `label` node: CREATE on an initial load,
+    else MERGE on `key`. Rows carry only non-null columns, so `+=` leaves
+    properties for blank cells alone rather than writing them.
+    """
+    if INITIAL_LOAD:
+        return f"UNWIND $rows AS row CREATE (n:{label}) SET n = row"
+    return f"UNWIND $rows AS row MERGE (n:{label} {{{key}: row.{key}}}) SET n += row"
 
-def run_batch(query, rows):
-    with driver.session() as session:
-        session.run(query, {"rows": rows})
+async def import_csv(filename, query, casts=None, dedup_key=None, parallel=False, session=None):
+    """
+    Feed a CSV through an UNWIND $rows query batch by batch; returns the row count.
+    `casts` maps column name → Arrow type (see read_csv_batches).
+    `dedup_key` (tuple of columns) collapses rows sharing the MERGE key before
+    anything is sent, last row winning as with repeated MERGE ... SET.
+    Deduplicated files of APOC_ITERATE_MIN_ROWS or more go through
+    apoc.periodic.iterate instead, with `parallel` batches if requested;
+    with LOAD_CSV_IMPORT_DIR set, large relationship files use LOAD CSV.
+    Runs on `session` if given, else on a session of its own.
+    """
+    if session is None:
+        async with async_driver.session(**SESSION_KW) as session:
+            return await import_csv(filename, query, casts, dedup_key, parallel, session)
+    count = 0
+    unique = {}
+    if dedup_key and LOAD_CSV_IMPORT_DIR and count_csv_rows(filename) >= LOAD_CSV_MIN_ROWS:
+        # No Python-side dedup on this path, so always MERGE
+        body = (query.replace("UNWIND $rows AS row", "", 1)
+                     .replace(f"{REL_WRITE} (", "MERGE (", 1))
+        cypher_casts = {col: CYPHER_CASTS[cast] for col, cast in (casts or {}).items()}
+        return await import_via_load_csv(session, filename, body, cypher_casts)
+    for rows in read_csv_batches(filename, casts):
+        # Leave out nulls: Neo4j stores no property for them and Bolt skips them
+        rows = [{k: v for k, v in row.items() if v is not None} for row in rows]
+        count += len(rows)
+        if dedup_key:
+            for row in rows:
+                unique[tuple(row.get(c) for c in dedup_key)] = row
+        else:
+            await run_chunked_async(session, query, rows)
+    if dedup_key:
+        rows = list(unique.values())
+        if count > len(rows):
+            print(f"  [dedup] {filename}: {count - len(rows)} duplicate rows dropped")
+        if len(rows) >= APOC_ITERATE_MIN_ROWS:
+            # Sorted on the key, parallel batches mostly touch disjoint start nodes
+            rows.sort(key=lambda row: tuple(row.get(c) or "" for c in dedup_key))
+            inner = query.replace("UNWIND $rows AS row", "", 1)
+            await run_apoc_iterate(session, inner, rows, parallel=parallel)
+        else:
+            await run_chunked_async(session, query, rows)
+        count = len(rows)
+    return count
 
 # ─── STEP 1: CONSTRAINTS & INDEXES ────────────────────────────────────────────
-def create_constraints():
+def run_ddl(statements):
+    """Run schema statements on one session (each still auto-commits on its own)."""
+    with driver.session(**SESSION_KW) as session:
+        for q in statements:
+            try:
+                session.run(q).consume()
+            except Exception as e:
+                print(f"  [skip] {e}")
+
+def create_constraints_only():
+    """Uniqueness constraints, range and vector indexes; runs before any importer starts."""
     print("Creating constraints and indexes...")
     constraints = [
         "CREATE CONSTRAINT IF NOT EXISTS FOR (n:LegalSection) REQUIRE n.section_id IS UNIQUE",
@@ -53,240 +339,237 @@ def create_constraints():
         "CREATE INDEX IF NOT EXISTS FOR (n:LegalSection) ON (n.category)",
         "CREATE INDEX IF NOT EXISTS FOR (n:LegalSection) ON (n.severity_level)",
         "CREATE INDEX IF NOT EXISTS FOR (n:CaseType)     ON (n.case_category)",
-        "CREATE FULLTEXT INDEX IF NOT EXISTS sectionFulltext FOR (n:LegalSection) ON EACH [n.section_title, n.layman_explanation, n.embedding_text]",
-        "CREATE FULLTEXT INDEX IF NOT EXISTS actionFulltext  FOR (n:LegalAction)  ON EACH [n.action_name, n.embedding_text]",
     ]
-    for q in constraints + indexes:
-        try:
-            run(q)
-        except Exception as e:
-            print(f"  [skip] {e}")
+    run_ddl(constraints + indexes)
+    create_vector_index()
     print("  ✓ Constraints and indexes ready")
 
+def create_vector_index():
+    """
+    sectionVec for the API's neural layer. Quantisation needs Neo4j 5.23+;
+    5.13–5.22 reject the option, so retry without it there.
+    """
+    vector_index = (
+        "CREATE VECTOR INDEX sectionVec IF NOT EXISTS FOR (n:LegalSection) ON (n.embedding) "
+        "OPTIONS {{indexConfig: {{`vector.dimensions`: {dim}, "
+        "`vector.similarity_function`: 'cosine'{extra}}}}}"
+    )
+    with driver.session(**SESSION_KW) as session:
+        try:
+            session.run(vector_index.format(
+                dim=EMBEDDING_DIM, extra=", `vector.quantization.enabled`: true")).consume()
+        except ClientError as e:
+            print(f"  [retry] sectionVec without quantisation: {e.message}")
+            try:
+                session.run(vector_index.format(dim=EMBEDDING_DIM, extra="")).consume()
+            except ClientError as e:
+                print(f"  [skip] {e}")
+
+def drop_fulltext_indexes():
+    """
+    Drop the full-text indexes (main.py's startup also creates sectionFulltext)
+    so the node import below does not pay a Lucene update per row.
+    """
+    print("Dropping full-text indexes for the import...")
+    run_ddl([
+        "DROP INDEX sectionFulltext IF EXISTS",
+        "DROP INDEX actionFulltext IF EXISTS",
+    ])
+
+def create_fulltext_indexes():
+    """
+    Full-text indexes, created once the nodes exist: Lucene then builds them in
+    one bulk pass instead of updating per property per imported row.
+    """
+    print("Creating full-text indexes...")
+    run_ddl([
+        "CREATE FULLTEXT INDEX IF NOT EXISTS sectionFulltext FOR (n:LegalSection) ON EACH [n.section_title, n.layman_explanation, n.embedding_text]",
+        "CREATE FULLTEXT INDEX IF NOT EXISTS actionFulltext  FOR (n:LegalAction)  ON EACH [n.action_name, n.embedding_text]",
+    ])
+    print("  ✓ Full-text indexes ready")
+
 # ─── STEP 2: IMPORT NODES ─────────────────────────────────────────────────────
 
-def import_legal_sections():
+async def import_legal_sections():
     print("Importing LegalSection nodes...")
-    df = pd.read_csv(os.path.join(DATA_DIR, "legal_sections__1_.csv")).fillna("")
-    rows = df.to_dict(orient="records")
+    count = await import_csv("legal_sections__1_.csv", node_query("LegalSection", "section_id"),
+                             casts={"max_punishment_years": pa.int64()})
+    print(f"  ✓ {count} LegalSection nodes imported")
+
+
+def import_section_embeddings():
+    print("Embedding LegalSection nodes...")
+    columns = ["section_id", "embedding_text"]
+    table = pacsv.read_csv(
+        os.path.join(DATA_DIR, "legal_sections__1_.csv"),
+        read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+        parse_options=CSV_PARSE_OPTIONS,
+        convert_options=pacsv.ConvertOptions(
+            include_columns=columns,
+            column_types={c: pa.string() for c in columns}),
+    )
+    texts = [t or "" for t in table.column("embedding_text").to_pylist()]
+    model = SentenceTransformer(EMBEDDING_MODEL)
+    vectors = model.encode(
+        texts,
+        batch_size=EMBEDDING_BATCH_SIZE,
+        normalize_embeddings=True,
+    )
+    rows = [{"section_id": sid, "embedding": vec.tolist()}
+            for sid, vec in zip(table.column("section_id").to_pylist(), vectors)]
     query = """
     UNWIND $rows AS row
-    MERGE (n:LegalSection {section_id: row.section_id})
-    SET
-      n.section_number     = row.section_number,
-      n.act_name           = row.act_name,
-      n.chapter_name       = row.chapter_name,
-      n.section_title      = row.section_title,
-      n.full_text          = row.full_text,
-      n.layman_explanation = row.layman_explanation,
-      n.category           = row.category,
-      n.severity_level     = row.severity_level,
-      n.punishment_summary = row.punishment_summary,
-      n.max_punishment_years = toIntegerOrNull(toString(row.max_punishment_years)),
-      n.cognizable         = row.cognizable,
-      n.bailable           = row.bailable,
-      n.applicable_states  = row.applicable_states,
-      n.is_compoundable    = row.is_compoundable,
-      n.embedding_text     = row.embedding_text
+    MATCH (n:LegalSection {section_id: row.section_id})
+    CALL db.create.setNodeVectorProperty(n, 'embedding', row.embedding)
     """
-    run_batch(query, rows)
-    print(f"  ✓ {len(rows)} LegalSection nodes imported")
+    run_chunked(query, rows)
+    print(f"  ✓ {len(rows)} LegalSection embeddings stored")
 
 
-def import_legal_actions():
+async def import_legal_actions():
     print("Importing LegalAction nodes...")
-    df = pd.read_csv(os.path.join(DATA_DIR, "legal_actions__.csv")).fillna("")
-    rows = df.to_dict(orient="records")
-    query = """
-    UNWIND $rows AS row
-    MERGE (n:LegalAction {action_id: row.action_id})
-    SET
-      n.action_name        = row.action_name,
-      n.action_type        = row.action_type,
-      n.authority_involved = row.authority_involved,
-      n.prerequisites      = row.prerequisites,
-      n.time_limit_days    = toString(row.time_limit_days),
-      n.cost_estimate_min  = toIntegerOrNull(toString(row.cost_estimate_min)),
-      n.cost_estimate_max  = toIntegerOrNull(toString(row.cost_estimate_max)),
-      n.online_possible    = row.online_possible,
-      n.risk_level         = row.risk_level,
-      n.procedure_steps    = row.procedure_steps,
-      n.embedding_text     = row.embedding_text
-    """
-    run_batch(query, rows)
-    print(f"  ✓ {len(rows)} LegalAction nodes imported")
+    count = await import_csv("legal_actions__.csv", node_query("LegalAction", "action_id"),
+                             casts={"time_limit_days": pa.string(),
+                                    "cost_estimate_min": pa.int64(),
+                                    "cost_estimate_max": pa.int64()})
+    print(f"  ✓ {count} LegalAction nodes imported")
 
 
-def import_case_types():
+async def import_case_types():
     print("Importing CaseType nodes...")
-    df = pd.read_csv(os.path.join(DATA_DIR, "case_type_1.csv")).fillna("")
-    rows = df.to_dict(orient="records")
-    query = """
-    UNWIND $rows AS row
-    MERGE (n:CaseType {case_type_id: row.case_type_id})
-    SET
-      n.case_category             = row.case_category,
-      n.scenario_description      = row.scenario_description,
-      n.keywords                  = row.keywords,
-      n.typical_duration_months   = toIntegerOrNull(toString(row.typical_duration_months)),
-      n.recommended_first_action  = row.recommended_first_action,
-      n.common_mistakes           = row.common_mistakes,
-      n.embedding_text            = row.embedding_text
-    """
-    run_batch(query, rows)
-    print(f"  ✓ {len(rows)} CaseType nodes imported")
+    count = await import_csv("case_type_1.csv", node_query("CaseType", "case_type_id"),
+                             casts={"typical_duration_months": pa.int64()})
+    print(f"  ✓ {count} CaseType nodes imported")
 
 
-def import_evidence():
+async def import_evidence():
     print("Importing Evidence nodes...")
-    df = pd.read_csv(os.path.join(DATA_DIR, "evidence_requirements.csv")).fillna("")
-    rows = df.to_dict(orient="records")
-    query = """
-    UNWIND $rows AS row
-    MERGE (n:Evidence {evidence_id: row.evidence_id})
-    SET
-      n.evidence_type        = row.evidence_type,
-      n.evidence_name        = row.evidence_name,
-      n.description          = row.description,
-      n.mandatory_or_optional= row.mandatory_or_optional,
-      n.collection_difficulty= row.collection_difficulty,
-      n.legal_weight         = row.legal_weight,
-      n.evidence_source      = row.evidence_source,
-      n.tamper_risk          = row.tamper_risk,
-      n.storage_requirements = row.storage_requirements,
-      n.embedding_text       = row.embedding_text
-    """
-    run_batch(query, rows)
-    print(f"  ✓ {len(rows)} Evidence nodes imported")
+    count = await import_csv("evidence_requirements.csv", node_query("Evidence", "evidence_id"))
+    print(f"  ✓ {count} Evidence nodes imported")
 
 
-def import_outcomes():
+async def import_outcomes():
     print("Importing Outcome nodes...")
-    df = pd.read_csv(os.path.join(DATA_DIR, "outcomes.csv")).fillna("")
-    rows = df.to_dict(orient="records")
-    query = """
-    UNWIND $rows AS row
-    MERGE (n:Outcome {outcome_id: row.outcome_id})
-    SET
-      n.outcome_description      = row.outcome_description,
-      n.outcome_type             = row.outcome_type,
-      n.typical_timeline_months  = toIntegerOrNull(toString(row.typical_timeline_months)),
-      n.financial_implications   = row.financial_implications,
-      n.appeal_possible          = row.appeal_possible,
-      n.enforcement_mechanism    = row.enforcement_mechanism,
-      n.precedent_cases          = row.precedent_cases,
-      n.embedding_text           = row.embedding_text
-    """
-    run_batch(query, rows)
-    print(f"  ✓ {len(rows)} Outcome nodes imported")
+    count = await import_csv("outcomes.csv", node_query("Outcome", "outcome_id"),
+                             casts={"typical_timeline_months": pa.int64()})
+    print(f"  ✓ {count} Outcome nodes imported")
 
 
 # ─── STEP 3: IMPORT RELATIONSHIPS ─────────────────────────────────────────────
 
-def import_section_relationships():
+async def import_section_relationships(session=None):
     print("Importing Section→Section relationships...")
-    df = pd.read_csv(os.path.join(DATA_DIR, "section_relationships.csv")).fillna("")
-    rows = df.to_dict(orient="records")
-    query = """
+    query = f"""
     UNWIND $rows AS row
-    MATCH (parent:LegalSection {section_id: row.parent_section_id})
-    MATCH (child:LegalSection  {section_id: row.child_section_id})
-    MERGE (parent)-[r:RELATED_TO {relationship_type: row.relationship_type}]->(child)
+    MATCH (parent:LegalSection {{section_id: row.parent_section_id}})
+    MATCH (child:LegalSection  {{section_id: row.child_section_id}})
+    {REL_WRITE} (parent)-[r:RELATED_TO {{relationship_type: row.relationship_type}}]->(child)
     SET r.explanation = row.explanation
     """
-    run_batch(query, rows)
-    print(f"  ✓ {len(rows)} Section→Section edges created")
+    count = await import_csv("section_relationships.csv", query,
+                             dedup_key=("parent_section_id", "child_section_id", "relationship_type"),
+                             session=session)
+    print(f"  ✓ {count} Section→Section edges created")
 
 
-def import_section_to_action():
+async def import_section_to_action(session=None):
     print("Importing Section→Action relationships...")
-    df = pd.read_csv(os.path.join(DATA_DIR, "section_to_action.csv")).fillna("")
-    rows = df.to_dict(orient="records")
-    query = """
+    query = f"""
     UNWIND $rows AS row
-    MATCH (s:LegalSection {section_id: row.section_id})
-    MATCH (a:LegalAction  {action_id:  row.action_id})
-    MERGE (s)-[r:HAS_ACTION]->(a)
+    MATCH (s:LegalSection {{section_id: row.section_id}})
+    MATCH (a:LegalAction  {{action_id:  row.action_id}})
+    {REL_WRITE} (s)-[r:HAS_ACTION]->(a)
     SET
       r.action_sequence   = row.action_sequence,
       r.conditions_required = row.conditions_required
     """
-    run_batch(query, rows)
-    print(f"  ✓ {len(rows)} Section→Action edges created")
+    count = await import_csv("section_to_action.csv", query,
+                             dedup_key=("section_id", "action_id"), parallel=True,
+                             session=session)
+    print(f"  ✓ {count} Section→Action edges created")
 
 
-def import_section_to_evidence():
+async def import_section_to_evidence(session=None):
     print("Importing Section→Evidence relationships...")
-    df = pd.read_csv(os.path.join(DATA_DIR, "section_to_evidence.csv")).fillna("")
-    rows = df.to_dict(orient="records")
-    query = """
+    query = f"""
     UNWIND $rows AS row
-    MATCH (s:LegalSection {section_id: row.section_id})
-    MATCH (e:Evidence     {evidence_id: row.evidence_id})
-    MERGE (s)-[r:REQUIRES_EVIDENCE]->(e)
+    MATCH (s:LegalSection {{section_id: row.section_id}})
+    MATCH (e:Evidence     {{evidence_id: row.evidence_id}})
+    {REL_WRITE} (s)-[r:REQUIRES_EVIDENCE]->(e)
     SET
       r.necessity_level = row.necessity_level,
       r.how_it_proves   = row.how_it_proves
     """
-    run_batch(query, rows)
-    print(f"  ✓ {len(rows)} Section→Evidence edges created")
+    count = await import_csv("section_to_evidence.csv", query,
+                             dedup_key=("section_id", "evidence_id"),
+                             session=session)
+    print(f"  ✓ {count} Section→Evidence edges created")
 
 
-def import_section_to_case_type():
+async def import_section_to_case_type(session=None):
     print("Importing Section→CaseType relationships...")
-    df = pd.read_csv(os.path.join(DATA_DIR, "section_to_case_type.csv")).fillna("")
-    rows = df.to_dict(orient="records")
-    query = """
+    query = f"""
     UNWIND $rows AS row
-    MATCH (s:LegalSection {section_id:  row.section_id})
-    MATCH (c:CaseType     {case_type_id: row.case_type_id})
-    MERGE (s)-[r:MAPS_TO_CASE_TYPE {section_id: row.section_id, case_type_id: row.case_type_id}]->(c)
+    MATCH (s:LegalSection {{section_id:  row.section_id}})
+    MATCH (c:CaseType     {{case_type_id: row.case_type_id}})
+    {REL_WRITE} (s)-[r:MAPS_TO_CASE_TYPE]->(c)
     SET
-      r.relevance_score = toFloatOrNull(toString(row.relevance_score)),
+      r.relevance_score = row.relevance_score,
       r.conditions      = row.conditions,
       r.exceptions      = row.exceptions
+    REMOVE r.section_id, r.case_type_id
     """
-    run_batch(query, rows)
-    print(f"  ✓ {len(rows)} Section→CaseType edges created")
+    count = await import_csv("section_to_case_type.csv", query,
+                             casts={"relevance_score": pa.float64()},
+                             dedup_key=("section_id", "case_type_id"),
+                             session=session)
+    print(f"  ✓ {count} Section→CaseType edges created")
 
 
-def import_action_to_outcome():
+async def import_action_to_outcome(session=None):
     print("Importing Action→Outcome relationships...")
-    df = pd.read_csv(os.path.join(DATA_DIR, "action_to_outcome.csv")).fillna("")
-    rows = df.to_dict(orient="records")
-    query = """
+    query = f"""
     UNWIND $rows AS row
-    MATCH (a:LegalAction {action_id:  row.action_id})
-    MATCH (o:Outcome     {outcome_id: row.outcome_id})
-    MERGE (a)-[r:LEADS_TO_OUTCOME]->(o)
+    MATCH (a:LegalAction {{action_id:  row.action_id}})
+    MATCH (o:Outcome     {{outcome_id: row.outcome_id}})
+    {REL_WRITE} (a)-[r:LEADS_TO_OUTCOME]->(o)
     SET
-      r.probability_percentage = toIntegerOrNull(toString(row.probability_percentage)),
+      r.probability_percentage = row.probability_percentage,
       r.influencing_factors    = row.influencing_factors
     """
-    run_batch(query, rows)
-    print(f"  ✓ {len(rows)} Action→Outcome edges created")
+    count = await import_csv("action_to_outcome.csv", query,
+                             casts={"probability_percentage": pa.int64()},
+                             dedup_key=("action_id", "outcome_id"),
+                             session=session)
+    print(f"  ✓ {count} Action→Outcome edges created")
 
 
 # ─── STEP 4: VERIFICATION ─────────────────────────────────────────────────────
 
 def verify():
     print("\nVerification — node & relationship counts:")
-    counts = {
-        "LegalSection nodes":        "MATCH (n:LegalSection) RETURN count(n) AS c",
-        "LegalAction nodes":         "MATCH (n:LegalAction)  RETURN count(n) AS c",
-        "CaseType nodes":            "MATCH (n:CaseType)     RETURN count(n) AS c",
-        "Evidence nodes":            "MATCH (n:Evidence)     RETURN count(n) AS c",
-        "Outcome nodes":             "MATCH (n:Outcome)      RETURN count(n) AS c",
-        "RELATED_TO edges":          "MATCH ()-[r:RELATED_TO]->()          RETURN count(r) AS c",
-        "HAS_ACTION edges":          "MATCH ()-[r:HAS_ACTION]->()          RETURN count(r) AS c",
-        "REQUIRES_EVIDENCE edges":   "MATCH ()-[r:REQUIRES_EVIDENCE]->()   RETURN count(r) AS c",
-        "MAPS_TO_CASE_TYPE edges":   "MATCH ()-[r:MAPS_TO_CASE_TYPE]->()   RETURN count(r) AS c",
-        "LEADS_TO_OUTCOME edges":    "MATCH ()-[r:LEADS_TO_OUTCOME]->()    RETURN count(r) AS c",
-    }
-    with driver.session() as session:
-        for label, q in counts.items():
-            result = session.run(q).single()
-            print(f"  {result['c']:>5}  {label}")
+    labels    = ["LegalSection", "LegalAction", "CaseType", "Evidence", "Outcome"]
+    rel_types = ["RELATED_TO", "HAS_ACTION", "REQUIRES_EVIDENCE", "MAPS_TO_CASE_TYPE",
+                 "LEADS_TO_OUTCOME"]
+    with driver.session(**READ_SESSION_KW) as session:
+        try:
+            # Read straight from the counts store: no scans, one round-trip
+            stats = session.run(
+                "CALL apoc.meta.stats() YIELD labels, relTypesCount "
+                "RETURN labels, relTypesCount"
+            ).single()
+            node_counts, rel_counts = stats["labels"], stats["relTypesCount"]
+        except ClientError:
+            # No APOC: every count in one UNION ALL query instead
+            q = " UNION ALL ".join(
+                [f"MATCH (n:{l}) RETURN '{l}' AS k, count(n) AS c" for l in labels]
+                + [f"MATCH ()-[r:{t}]->() RETURN '{t}' AS k, count(r) AS c" for t in rel_types]
+            )
+            node_counts = rel_counts = {r["k"]: r["c"] for r in session.run(q)}
+    for l in labels:
+        print(f"  {node_counts.get(l, 0):>5}  {l} nodes")
+    for t in rel_types:
+        print(f"  {rel_counts.get(t, 0):>5}  {t} edges")
 
     # Sample query — full graph traversal for one case
     print("\nSample traversal — IPC 417 (Cheating) full path:")
@@ -304,7 +587,7 @@ def verify():
       collect(DISTINCT {outcome: o.outcome_description, prob: lo.probability_percentage}) AS outcomes
     LIMIT 1
     """
-    with driver.session() as session:
+    with driver.session(**READ_SESSION_KW) as session:
         result = session.run(sample).single()
         if result:
             print(f"  Section    : {result['section']}")
@@ -314,27 +597,164 @@ def verify():
             print(f"  Outcomes   : {[o['outcome'][:50] for o in result['outcomes'] if o['outcome']][:2]}")
 
 
+# ─── STEP 5: OFFLINE BULK IMPORT (neo4j-admin) ────────────────────────────────
+# neo4j-admin writes the store files directly: no transactions, locks or
+# constraint checks per row. Only for the first load into an empty database;
+# the online UNWIND path above stays the way to apply incremental updates.
+
+# neo4j-admin header type for each cast; admin's int/float are 32-bit, so the
+# 64-bit long/double keep values identical to the online import
+ADMIN_TYPE_NAMES = {pa.int64(): "long", pa.float64(): "double", pa.string(): "string"}
+
+# (csv, label, id column, {column: Arrow type})
+ADMIN_NODES = [
+    ("legal_sections__1_.csv",    "LegalSection", "section_id",
+     {"max_punishment_years": pa.int64()}),
+    ("legal_actions__.csv",       "LegalAction",  "action_id",
+     {"cost_estimate_min": pa.int64(), "cost_estimate_max": pa.int64()}),
+    ("case_type_1.csv",           "CaseType",     "case_type_id",
+     {"typical_duration_months": pa.int64()}),
+    ("evidence_requirements.csv", "Evidence",     "evidence_id",  {}),
+    ("outcomes.csv",              "Outcome",      "outcome_id",
+     {"typical_timeline_months": pa.int64()}),
+]
+
+# (csv, type, (start column, id space), (end column, id space), dedup key,
+#  {column: Arrow type})
+ADMIN_RELATIONSHIPS = [
+    ("section_relationships.csv", "RELATED_TO",
+     ("parent_section_id", "LegalSection"), ("child_section_id", "LegalSection"),
+     ("parent_section_id", "child_section_id", "relationship_type"), {}),
+    ("section_to_action.csv",     "HAS_ACTION",
+     ("section_id", "LegalSection"), ("action_id", "LegalAction"),
+     ("section_id", "action_id"), {}),
+    ("section_to_evidence.csv",   "REQUIRES_EVIDENCE",
+     ("section_id", "LegalSection"), ("evidence_id", "Evidence"),
+     ("section_id", "evidence_id"), {}),
+    ("section_to_case_type.csv",  "MAPS_TO_CASE_TYPE",
+     ("section_id", "LegalSection"), ("case_type_id", "CaseType"),
+     ("section_id", "case_type_id"), {"relevance_score": pa.float64()}),
+    ("action_to_outcome.csv",     "LEADS_TO_OUTCOME",
+     ("action_id", "LegalAction"), ("outcome_id", "Outcome"),
+     ("action_id", "outcome_id"), {"probability_percentage": pa.int64()}),
+]
+
+def write_admin_csv(filename, header_for, extra_header, extra_value, types, dedup_key=None):
+    """
+    Rewrite a DATA_DIR CSV into ADMIN_IMPORT_DIR with neo4j-admin headers.
+    `header_for(column)` names each header field; `extra_header`/`extra_value`
+    append the :LABEL or :TYPE column. Returns the output path.
+    """
+    rows, unique = [], {}
+    for batch in read_csv_batches(filename, types):
+        for row in batch:
+            if dedup_key:
+                unique[tuple(row[c] for c in dedup_key)] = row
+            else:
+                rows.append(row)
+    if dedup_key:
+        rows = list(unique.values())
+    path = os.path.abspath(os.path.join(ADMIN_IMPORT_DIR, filename))
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        columns = list(rows[0]) if rows else []
+        writer.writerow([header_for(c) for c in columns] + [extra_header])
+        for row in rows:
+            writer.writerow([row[c] for c in columns] + [extra_value])
+    print(f"  ✓ {len(rows)} rows → {path}")
+    return path
+
+def typed(column, types):
+    return f"{column}:{ADMIN_TYPE_NAMES[types[column]]}" if column in types else column
+
+def main_admin_import(overwrite=False):
+    """
+    Offline initial load through `neo4j-admin database import full`.
+    neo4j-admin refuses a non-empty target database unless `overwrite` is set
+    (--overwrite on the command line), which replaces all its data.
+    """
+    print("Writing neo4j-admin import files...")
+    os.makedirs(ADMIN_IMPORT_DIR, exist_ok=True)
+    args = []
+    for filename, label, id_col, types in ADMIN_NODES:
+        path = write_admin_csv(
+            filename,
+            lambda c, id_col=id_col, label=label, types=types:
+                f"{c}:ID({label})" if c == id_col else typed(c, types),
+            ":LABEL", label, types,
+        )
+        args.append(f"--nodes={path}")
+    for filename, rel_type, (start, start_space), (end, end_space), key, types in ADMIN_RELATIONSHIPS:
+        headers = {start: f":START_ID({start_space})", end: f":END_ID({end_space})"}
+        path = write_admin_csv(
+            filename,
+            lambda c, headers=headers, types=types: headers.get(c) or typed(c, types),
+            ":TYPE", rel_type, types, dedup_key=key,
+        )
+        args.append(f"--relationships={path}")
+
+    print(f"\nRunning {NEO4J_ADMIN} database import full {ADMIN_DATABASE}...")
+    subprocess.run(
+        [NEO4J_ADMIN, "database", "import", "full", ADMIN_DATABASE,
+         *(["--overwrite-destination"] if overwrite else []),
+         "--multiline-fields=true", *args],
+        check=True,
+    )
+    print("  ✓ Store files written")
+    print("\nStart the database, then run:")
+    print("  python neo4j_import.py --admin-finish")
+    print("  to create constraints and indexes and store the section embeddings.")
+
+def finish_admin_import():
+    """Online steps neo4j-admin cannot do: schema, embeddings, verification."""
+    create_constraints_only()
+    create_fulltext_indexes()
+    import_section_embeddings()
+    verify()
+
+
+async def main_async():
+    drop_fulltext_indexes()
+    print("\nImporting nodes...")
+    await asyncio.gather(
+        import_legal_sections(),
+        import_legal_actions(),
+        import_case_types(),
+        import_evidence(),
+        import_outcomes(),
+    )
+    create_fulltext_indexes()
+    import_section_embeddings()   # MATCHes the LegalSection nodes imported above
+
+    print("\nImporting relationships...")
+    async with async_driver.session(**SESSION_KW) as session:   # one session for the sequential phase
+        await import_section_relationships(session)
+        await import_section_to_action(session)
+        await import_section_to_evidence(session)
+        await import_section_to_case_type(session)
+        await import_action_to_outcome(session)
+
+    await async_driver.close()
+
+
 # ─── MAIN ─────────────────────────────────────────────────────────────────────
 if __name__ == "__main__":
     print("=" * 60)
     print("  Legal Analyser — Neo4j Import")
     print("=" * 60)
 
-    create_constraints()
+    if "--admin" in sys.argv:
+        main_admin_import(overwrite="--overwrite" in sys.argv)
+        sys.exit(0)
+    if "--admin-finish" in sys.argv:
+        finish_admin_import()
+        driver.close()
+        sys.exit(0)
 
-    print("\nImporting nodes...")
-    import_legal_sections()
-    import_legal_actions()
-    import_case_types()
-    import_evidence()
-    import_outcomes()
+    check_initial_load()
+    create_constraints_only()
 
-    print("\nImporting relationships...")
-    import_section_relationships()
-    import_section_to_action()
-    import_section_to_evidence()
-    import_section_to_case_type()
-    import_action_to_outcome()
+    asyncio.run(main_async())
 
     verify()
 